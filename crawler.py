@@ -1,24 +1,110 @@
 #!/usr/bin/env python3
 
 import argparse
+import bisect
 import csv
+import functools
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import Select
-from urllib.parse import urlparse, parse_qs, urljoin
+from selenium.webdriver.support.ui import WebDriverWait
+from urllib.parse import urlparse, urljoin
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import orjson
+import queue
+import threading
 import time
 import re
+import string
 import logging
+import websocket
+
+# Optional: Bloom-filter prefilter for visited-URL checks on large crawls
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# urlparse re-runs its regex-based parser on every call and the same URLs
+# recur throughout a crawl; ParseResult is immutable so caching is safe
+_urlparse_cached = functools.lru_cache(maxsize=4096)(urlparse)
+
+# Pre-compiled validation patterns (is_valid_url is called on every candidate URL)
+_EXCLUDE_EXT_RE = re.compile(r'\.(css|js|ico|png|jpg|jpeg|gif|svg|woff|woff2|ttf|eot|map|txt|xml|pdf)$', re.IGNORECASE)
+_INVALID_RE = re.compile('|'.join([
+    r'function\(', r'\}\}', r'\|\|', r'\(\s*\)', r'\[.*\]', r'\{.*\}', r'==',
+    r'\?\d+:e=', r'\bvar\b', r'\bif\b', r'\belse\b', r'#\\|\?\$\|', r',Pt=function'
+]))
+# Character-class membership via str.translate: the tables delete every
+# allowed character, so a non-empty result means a disallowed one is present
+_PATH_TRANS = str.maketrans('', '', string.ascii_letters + string.digits + '-_/')
+_QUERY_TRANS = str.maketrans('', '', string.ascii_letters + string.digits + '=&%_')
+
+# JS endpoint extraction: one fused path pattern and one pass over the file
+# collecting every HTTP-method indicator with its offset
+_JS_PATH_RE = re.compile(r'[\'"]?(https?://[^"\s\'<>]+|/[^"\s\'/<>][^"\s\'<>]*?/[^"\s\'/<>][^"\s\'<>]*)[\'"]?')
+_JS_METHOD_RE = re.compile(
+    r'(?P<POST>\.post\s*\(|method:\s*[\'"]POST[\'"])|'
+    r'(?P<PUT>\.put\s*\(|method:\s*[\'"]PUT[\'"])|'
+    r'(?P<DELETE>\.delete\s*\(|method:\s*[\'"]DELETE[\'"])',
+    re.IGNORECASE
+)
+
+# In-page instrumentation counting in-flight fetch/XHR requests so waits can
+# key on network quiescence instead of fixed sleeps
+_NETWORK_TRACKER_SCRIPT = """
+if (!window.__crawlerPending) {
+    window.__crawlerPending = {count: 0};
+    const pending = window.__crawlerPending;
+    const origFetch = window.fetch;
+    window.fetch = function() {
+        pending.count++;
+        return origFetch.apply(this, arguments).finally(() => pending.count--);
+    };
+    const origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        pending.count++;
+        this.addEventListener('loadend', () => pending.count--);
+        return origSend.apply(this, arguments);
+    };
+}
+"""
+
+def wait_for_page_load(driver, timeout=10):
+    """Wait until the document is ready instead of sleeping a fixed interval."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except Exception as e:
+        logger.warning(f"Timed out waiting for page load: {str(e)}")
+    try:
+        driver.execute_script(_NETWORK_TRACKER_SCRIPT)
+    except Exception as e:
+        logger.warning(f"Could not install network tracker: {str(e)}")
+
+def wait_for_network_idle(driver, timeout=3):
+    """Wait until instrumented fetch/XHR traffic triggered by an interaction settles."""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(
+                "return !window.__crawlerPending || window.__crawlerPending.count === 0"
+            )
+        )
+    except Exception:
+        pass
+
 def get_driver(headless=False):
     """Initialize a browser driver with fallback."""
     try:
@@ -39,10 +125,55 @@ def get_driver(headless=False):
             logger.error(f"Firefox WebDriver failed: {str(e)}. No browser available.")
             raise Exception("No supported browser WebDriver found.")
 
+def start_network_listener(driver):
+    """Subscribe to CDP Network.requestWillBeSent events over a websocket.
+
+    Returns a queue of captured request payloads fed by a daemon reader
+    thread, or None if the push connection cannot be established (e.g. the
+    Firefox fallback driver), in which case callers should poll the
+    performance log instead.
+    """
+    try:
+        debugger_address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        targets = requests.get(f"http://{debugger_address}/json", timeout=5).json()
+        ws_url = next(t["webSocketDebuggerUrl"] for t in targets if t.get("type") == "page")
+        ws = websocket.create_connection(ws_url)
+        ws.send('{"id": 1, "method": "Network.enable"}')
+        events = queue.Queue()
+
+        def reader():
+            while True:
+                try:
+                    frame = ws.recv()
+                except Exception:
+                    break
+                if '"Network.requestWillBeSent"' not in frame:
+                    continue
+                try:
+                    message = orjson.loads(frame)
+                except orjson.JSONDecodeError:
+                    continue
+                if message.get("method") == "Network.requestWillBeSent":
+                    request = message.get("params", {}).get("request")
+                    if request:
+                        events.put(request)
+
+        threading.Thread(target=reader, daemon=True).start()
+        return events
+    except Exception as e:
+        logger.warning(f"CDP event subscription unavailable, falling back to performance log: {str(e)}")
+        return None
+
+@functools.lru_cache(maxsize=8192)
 def is_valid_url(url, base_domain):
-    """Validate if a URL is a legitimate endpoint."""
+    """Validate if a URL is a legitimate endpoint.
+
+    Pure in (url, base_domain) and the same URL is typically validated
+    several times per crawl (link discovery, network capture, dedup), so
+    results are memoized.
+    """
     try:
-        parsed_url = urlparse(url)
+        parsed_url = _urlparse_cached(url)
         if parsed_url.scheme not in ["http", "https"]:
             return False
         if base_domain not in parsed_url.netloc:
@@ -50,28 +181,48 @@ def is_valid_url(url, base_domain):
         path = parsed_url.path
         if not path or path == "/":
             return True
-        if not re.match(r'^/[a-zA-Z0-9\-_/]*$', path):
+        # Checks ordered by ascending cost so most URLs reject before the
+        # expensive invalid-pattern regex runs
+        if path[0] != '/' or path[1:].translate(_PATH_TRANS):
             return False
-        exclude_extensions = r'\.(css|js|ico|png|jpg|jpeg|gif|svg|woff|woff2|ttf|eot|map|txt|xml|pdf)$'
-        if re.search(exclude_extensions, path, re.IGNORECASE):
-            return False
-        invalid_patterns = [
-            r'function\(', r'\}\}', r'\|\|', r'\(\s*\)', r'\[.*\]', r'\{.*\}', r'==',
-            r'\?\d+:e=', r'\bvar\b', r'\bif\b', r'\belse\b', r'#\\|\?\$\|', r',Pt=function'
-        ]
-        full_url = url.lower()
-        if any(re.search(pattern, full_url) for pattern in invalid_patterns):
+        if '.' in path[-6:] and _EXCLUDE_EXT_RE.search(path):
             return False
         query = parsed_url.query
         if query:
-            if any(len(value) > 100 or re.search(r'[^a-zA-Z0-9=&%_]', value) for values in parse_qs(query).values() for value in values):
+            if query.translate(_QUERY_TRANS):
+                return False
+            if max(len(value) for value in query.split('&')) > 100:
                 return False
+        if _INVALID_RE.search(url.lower()):
+            return False
         return True
     except Exception:
         return False
 
+# Shared empty body for endpoints that carry no parameters
+_EMPTY_BODY = {}
+
+# Cap on how much of a JavaScript file is downloaded and scanned
+_MAX_JS_BYTES = 5_000_000
+
+def _fast_urljoin(base, ref):
+    """urljoin specialized for the dominant absolute/root-relative cases.
+
+    Skips the double urlparse inside urljoin when ref is already absolute,
+    and reuses a cached parse of base for root-relative refs; anything else
+    falls through to the stdlib implementation.
+    """
+    if ref.startswith(('http://', 'https://')):
+        return ref
+    if ref.startswith('/'):
+        parsed = _urlparse_cached(base)
+        return f"{parsed.scheme}://{parsed.netloc}{ref}"
+    return urljoin(base, ref)
+
 def extract_parameters(request_body):
     """Extract body parameters."""
+    if request_body is None:
+        return _EMPTY_BODY
     body_params = {}
     if request_body:
         try:
@@ -80,59 +231,59 @@ def extract_parameters(request_body):
             body_params = {"raw_body": request_body}
     return body_params
 
+# Serializes a form and fills test values in one in-page pass, replacing the
+# per-element is_displayed/get_attribute/send_keys round-trips
+_FORM_EXTRACT_SCRIPT = """
+const form = arguments[0];
+const fields = [];
+for (const el of form.elements) {
+    if (el.offsetParent === null || el.disabled) continue;
+    const tag = el.tagName.toLowerCase();
+    const type = (el.type || '').toLowerCase();
+    let value = null;
+    if (tag === 'textarea') {
+        value = 'Sample text';
+        el.value = value;
+    } else if (tag === 'select') {
+        if (!el.options.length) continue;
+        el.selectedIndex = el.options.length - 1;
+        value = el.options[el.selectedIndex].value;
+    } else if (type === 'checkbox' || type === 'radio') {
+        el.checked = true;
+        value = el.value || 'on';
+    } else if (['text', 'search', 'email', 'password', 'number'].includes(type)) {
+        value = type === 'password' ? 'Test123!' : (type === 'number' ? '42' : 'test');
+        el.value = value;
+    } else {
+        continue;
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    fields.push({name: el.name, tag: tag, type: type, value: value});
+}
+return {action: form.getAttribute('action'), method: form.method, fields: fields};
+"""
+
 def extract_form_data(form, driver):
     """Extract form data without submitting."""
-    form_data = {}
     try:
-        inputs = form.find_elements(By.CSS_SELECTOR, "input[type='text'], input[type='search'], input[type='email'], input[type='password'], input[type='number'], textarea")
-        selects = form.find_elements(By.TAG_NAME, "select")
-        checkboxes = form.find_elements(By.CSS_SELECTOR, "input[type='checkbox'], input[type='radio']")
-        
-        for input_field in inputs:
-            try:
-                if input_field.is_displayed() and input_field.is_enabled():
-                    name = input_field.get_attribute("name") or f"input_{len(form_data)}"
-                    input_type = input_field.get_attribute("type")
-                    value = "test"
-                    if input_type == "password":
-                        value = "Test123!"
-                    elif input_type == "number":
-                        value = "42"
-                    elif input_field.tag_name == "textarea":
-                        value = "Sample text"
-                    input_field.send_keys(value)
-                    form_data[name] = value
-            except Exception as e:
-                logger.warning(f"Error processing input field: {str(e)}")
-        
-        for select in selects:
-            try:
-                if select.is_displayed() and select.is_enabled():
-                    select_obj = Select(select)
-                    name = select.get_attribute("name") or f"select_{len(form_data)}"
-                    options = select_obj.options
-                    if options:
-                        select_obj.select_by_index(len(options) - 1)
-                        selected_option = select_obj.first_selected_option
-                        form_data[name] = selected_option.get_attribute("value")
-            except Exception as e:
-                logger.warning(f"Error processing dropdown: {str(e)}")
-        
-        for checkbox in checkboxes:
-            try:
-                if checkbox.is_displayed() and checkbox.is_enabled():
-                    name = checkbox.get_attribute("name") or f"checkbox_{len(form_data)}"
-                    if not checkbox.is_selected():
-                        checkbox.click()
-                    form_data[name] = checkbox.get_attribute("value") or "on"
-            except Exception as e:
-                logger.warning(f"Error processing checkbox/radio: {str(e)}")
-        
-        action = form.get_attribute("action")
-        method = form.get_attribute("method") or "POST"
+        extracted = driver.execute_script(_FORM_EXTRACT_SCRIPT, form)
+        form_data = {}
+        for field in extracted["fields"]:
+            if field["tag"] == "select":
+                prefix = "select"
+            elif field["type"] in ("checkbox", "radio"):
+                prefix = "checkbox"
+            else:
+                prefix = "input"
+            name = field["name"] or f"{prefix}_{len(form_data)}"
+            form_data[name] = field["value"]
+
+        action = extracted["action"]
+        method = extracted["method"] or "POST"
         base_url = driver.current_url
-        full_url = urljoin(base_url, action) if action else base_url
-        
+        full_url = _fast_urljoin(base_url, action) if action else base_url
+
         return {
             "url": full_url,
             "method": method.upper(),
@@ -146,172 +297,260 @@ def extract_form_data(form, driver):
 def extract_endpoints_from_js(js_content, base_url):
     """Extract valid endpoints from JavaScript content with method inference."""
     endpoints = []
-    path_pattern = r'(?:https?:\/\/[^"\s]+)|(?:/[^"\s/][^"\s]*?/[^"\s/][^\s"]*)'
-    quoted_path_pattern = r'[\'"](?:https?:\/\/[^"\s]+|/[^"\s/][^"\s]*?/[^"\s/][^\s"]*)[\'"]'
-    
-    paths = re.findall(path_pattern, js_content) + re.findall(quoted_path_pattern, js_content)
-    
-    base_domain = urlparse(base_url).netloc
-    for path in paths:
-        path = path.strip('"\'')
-        full_url = urljoin(base_url, path)
+
+    # Single pass over the file collecting method indicators with offsets,
+    # so each path only needs a bisect to find its nearest preceding indicator
+    indicator_offsets = []
+    indicator_methods = []
+    for match in _JS_METHOD_RE.finditer(js_content):
+        indicator_offsets.append(match.start())
+        indicator_methods.append(match.lastgroup)
+
+    base_domain = _urlparse_cached(base_url).netloc
+    for match in _JS_PATH_RE.finditer(js_content):
+        path = match.group(1)
+        full_url = _fast_urljoin(base_url, path)
         if is_valid_url(full_url, base_domain):
             method = "GET"
-            if re.search(r'\.post\s*\(', js_content, re.IGNORECASE) or re.search(r'method:\s*[\'"]POST[\'"]', js_content, re.IGNORECASE):
-                method = "POST"
-            elif re.search(r'\.put\s*\(', js_content, re.IGNORECASE) or re.search(r'method:\s*[\'"]PUT[\'"]', js_content, re.IGNORECASE):
-                method = "PUT"
-            elif re.search(r'\.delete\s*\(', js_content, re.IGNORECASE) or re.search(r'method:\s*[\'"]DELETE[\'"]', js_content, re.IGNORECASE):
-                method = "DELETE"
+            if indicator_offsets:
+                idx = bisect.bisect_right(indicator_offsets, match.start()) - 1
+                if idx >= 0:
+                    method = indicator_methods[idx]
             endpoints.append({"url": full_url, "method": method})
-    
+
     return endpoints
 
-def crawl_website(url, headers, max_pages, output_file, headless):
-    """Crawl a website and extract endpoints."""
-    driver = get_driver(headless)
-    endpoints = []
+def crawl_website(url, headers, max_pages, output_file, headless, workers=4):
+    """Crawl a website and extract endpoints using parallel browser workers."""
+    endpoints_by_url = {}
     visited_urls = set()
-    urls_to_visit = [url]
-    base_domain = urlparse(url).netloc
+    visited_bloom = ScalableBloomFilter(error_rate=1e-4) if ScalableBloomFilter is not None else None
+    urls_to_visit = deque([url])
+    queued_urls = {url}
+    base_domain = _urlparse_cached(url).netloc
     js_urls = set()
-    
+    state_lock = threading.Lock()
+    in_progress = [0]
+
     basic_headers = {
-        'Host', 'Connection', 'User-Agent', 'Accept', 'Accept-Encoding', 
-        'Accept-Language', 'Content-Length', 'Content-Type', 'Origin', 
+        'Host', 'Connection', 'User-Agent', 'Accept', 'Accept-Encoding',
+        'Accept-Language', 'Content-Length', 'Content-Type', 'Origin',
         'Referer', 'Sec-Fetch-Site', 'Sec-Fetch-Mode', 'Sec-Fetch-Dest'
     }
-    
-    try:
-        driver.execute_cdp_cmd("Network.enable", {})
-        driver.execute_cdp_cmd("Network.setExtraHTTPHeaders", {"headers": headers})
-        
-        while urls_to_visit and len(visited_urls) < max_pages:
-            current_url = urls_to_visit.pop(0)
-            if current_url in visited_urls:
-                continue
-            try:
-                driver.get(current_url)
+
+    def next_url():
+        """Reserve the next frontier URL, or None once the crawl is done."""
+        while True:
+            with state_lock:
+                if len(visited_urls) + in_progress[0] >= max_pages:
+                    return None
+                while urls_to_visit:
+                    candidate = urls_to_visit.popleft()
+                    # A bloom miss proves the URL was never visited without
+                    # touching the (potentially large) visited set
+                    if (visited_bloom is None or candidate in visited_bloom) and candidate in visited_urls:
+                        continue
+                    in_progress[0] += 1
+                    return candidate
+                if in_progress[0] == 0:
+                    return None
+            # Frontier is empty but pages still in flight may discover links
+            time.sleep(0.2)
+
+    def process_page(driver, network_events, current_url):
+        try:
+            driver.get(current_url)
+            with state_lock:
                 visited_urls.add(current_url)
-                time.sleep(2)
-            except Exception as e:
-                logger.error(f"Failed to load {current_url}: {str(e)}")
-                continue
-            try:
-                clickable_elements = driver.find_elements(By.CSS_SELECTOR, "button, input[type='button'], [onclick]")
-                for element in clickable_elements:
-                    try:
-                        if element.is_displayed() and element.is_enabled():
-                            element.click()
-                            time.sleep(1)
-                    except Exception as e:
-                        logger.warning(f"Error clicking element: {str(e)}")
-                forms = driver.find_elements(By.CSS_SELECTOR, "form")
-                for form in forms:
-                    try:
-                        if form.is_displayed():
-                            form_data = extract_form_data(form, driver)
-                            if form_data and is_valid_url(form_data["url"], base_domain):
-                                form_data["extra_headers"] = headers
-                                endpoints.append(form_data)
-                    except Exception as e:
-                        logger.warning(f"Error processing form: {str(e)}")
-                search_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='text'], input[type='search']")
-                for input_field in search_inputs:
-                    try:
-                        if input_field.is_displayed() and input_field.is_enabled():
-                            input_field.send_keys("test")
-                            input_field.send_keys(Keys.RETURN)
-                            time.sleep(1)
-                    except Exception as e:
-                        logger.warning(f"Error interacting with search bar: {str(e)}")
-                event_elements = driver.find_elements(By.CSS_SELECTOR, "[onchange], [oninput]")
-                for element in event_elements:
+                if visited_bloom is not None:
+                    visited_bloom.add(current_url)
+            wait_for_page_load(driver)
+        except Exception as e:
+            logger.error(f"Failed to load {current_url}: {str(e)}")
+            return
+        try:
+            clickable_elements = driver.find_elements(By.CSS_SELECTOR, "button, input[type='button'], [onclick]")
+            for element in clickable_elements:
+                try:
+                    if element.is_displayed() and element.is_enabled():
+                        element.click()
+                        wait_for_network_idle(driver)
+                except Exception as e:
+                    logger.warning(f"Error clicking element: {str(e)}")
+            forms = driver.find_elements(By.CSS_SELECTOR, "form")
+            for form in forms:
+                try:
+                    if form.is_displayed():
+                        form_data = extract_form_data(form, driver)
+                        if form_data and is_valid_url(form_data["url"], base_domain):
+                            form_data["extra_headers"] = headers
+                            with state_lock:
+                                endpoints_by_url.setdefault(form_data["url"], form_data)
+                except Exception as e:
+                    logger.warning(f"Error processing form: {str(e)}")
+            search_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='text'], input[type='search']")
+            for input_field in search_inputs:
+                try:
+                    if input_field.is_displayed() and input_field.is_enabled():
+                        input_field.send_keys("test")
+                        input_field.send_keys(Keys.RETURN)
+                        wait_for_network_idle(driver)
+                except Exception as e:
+                    logger.warning(f"Error interacting with search bar: {str(e)}")
+            event_elements = driver.find_elements(By.CSS_SELECTOR, "[onchange], [oninput]")
+            for element in event_elements:
+                try:
+                    if element.is_displayed() and element.is_enabled():
+                        if element.tag_name == "input":
+                            element.send_keys("test")
+                            wait_for_network_idle(driver, timeout=1)
+                except Exception as e:
+                    logger.warning(f"Error triggering event on element: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error interacting with elements on {current_url}: {str(e)}")
+        try:
+            captured_requests = []
+            if network_events is not None:
+                # Drain the already-decoded events pushed by the CDP listener
+                while True:
                     try:
-                        if element.is_displayed() and element.is_enabled():
-                            if element.tag_name == "input":
-                                element.send_keys("test")
-                                time.sleep(0.5)
-                    except Exception as e:
-                        logger.warning(f"Error triggering event on element: {str(e)}")
-            except Exception as e:
-                logger.error(f"Error interacting with elements on {current_url}: {str(e)}")
-            try:
+                        captured_requests.append(network_events.get_nowait())
+                    except queue.Empty:
+                        break
+            else:
                 logs = driver.get_log("performance")
                 for entry in logs:
                     try:
-                        message = json.loads(entry["message"])["message"]
+                        raw = entry["message"]
+                        # Cheap substring check skips the majority of log entries
+                        # (responses, data-received, etc.) before any JSON parse
+                        if '"Network.requestWillBeSent"' not in raw:
+                            continue
+                        message = orjson.loads(raw)["message"]
                         if message["method"] == "Network.requestWillBeSent":
-                            request = message["params"]["request"]
-                            request_url = request["url"]
-                            if is_valid_url(request_url, base_domain):
-                                body_params = extract_parameters(request.get("postData"))
-                                request_headers = {k: v for k, v in request.get("headers", {}).items() if k not in basic_headers}
-                                endpoints.append({
-                                    "url": request_url,
-                                    "method": request["method"],
-                                    "body_params": body_params,
-                                    "extra_headers": request_headers
-                                })
-                            if request_url.endswith(".js") and is_valid_url(request_url, base_domain):
-                                js_urls.add(request_url)
+                            captured_requests.append(message["params"]["request"])
                     except (KeyError, json.JSONDecodeError) as e:
                         logger.warning(f"Error processing log entry: {str(e)}")
-            except Exception as e:
-                logger.error(f"Error capturing network logs: {str(e)}")
-            try:
-                links = driver.find_elements(By.CSS_SELECTOR, "a[href], [href]")
-                for link in links:
-                    href = link.get_attribute("href")
+            with state_lock:
+                for request in captured_requests:
+                    try:
+                        request_url = request["url"]
+                        if is_valid_url(request_url, base_domain):
+                            body_params = extract_parameters(request.get("postData"))
+                            request_headers = {k: v for k, v in request.get("headers", {}).items() if k not in basic_headers}
+                            endpoints_by_url.setdefault(request_url, {
+                                "url": request_url,
+                                "method": request["method"],
+                                "body_params": body_params,
+                                "extra_headers": request_headers
+                            })
+                        if request_url.endswith(".js") and is_valid_url(request_url, base_domain):
+                            js_urls.add(request_url)
+                    except KeyError as e:
+                        logger.warning(f"Error processing network request: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error capturing network logs: {str(e)}")
+        try:
+            # One round-trip for all hrefs instead of a WebDriver call per link
+            hrefs = driver.execute_script(
+                "return Array.from(document.querySelectorAll('a[href], [href]'))"
+                ".map(el => el.href || el.getAttribute('href'));"
+            )
+            with state_lock:
+                for href in hrefs:
                     if href:
-                        parsed_href = urlparse(href)
+                        parsed_href = _urlparse_cached(href)
                         if parsed_href.netloc == base_domain or base_domain in parsed_href.netloc:
-                            full_url = urljoin(current_url, href)
-                            if is_valid_url(full_url, base_domain) and full_url not in visited_urls and full_url not in urls_to_visit:
+                            full_url = _fast_urljoin(current_url, href)
+                            if is_valid_url(full_url, base_domain) and full_url not in visited_urls and full_url not in queued_urls:
                                 urls_to_visit.append(full_url)
+                                queued_urls.add(full_url)
+        except Exception as e:
+            logger.error(f"Error extracting links from {current_url}: {str(e)}")
+
+    def crawl_worker():
+        try:
+            driver = get_driver(headless)
+        except Exception as e:
+            logger.error(f"Failed to start browser worker: {str(e)}")
+            return
+        try:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setExtraHTTPHeaders", {"headers": headers})
             except Exception as e:
-                logger.error(f"Error extracting links from {current_url}: {str(e)}")
-        for js_url in js_urls:
+                logger.warning(f"Could not configure CDP network capture: {str(e)}")
+            network_events = start_network_listener(driver)
+            while True:
+                current_url = next_url()
+                if current_url is None:
+                    break
+                try:
+                    process_page(driver, network_events, current_url)
+                finally:
+                    with state_lock:
+                        in_progress[0] -= 1
+        finally:
+            driver.quit()
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(crawl_worker) for _ in range(workers)]:
+                future.result()
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        def fetch_js(js_url):
             try:
-                response = requests.get(js_url, headers=headers, timeout=5)
-                if response.status_code == 200:
-                    js_endpoints = extract_endpoints_from_js(response.text, url)
-                    for endpoint in js_endpoints:
-                        body_params = extract_parameters(None)
-                        endpoints.append({
-                            "url": endpoint["url"],
-                            "method": endpoint["method"],
-                            "body_params": body_params,
-                            "extra_headers": headers
-                        })
+                with session.get(js_url, headers=headers, timeout=5, stream=True) as response:
+                    if response.status_code != 200:
+                        return []
+                    content_type = response.headers.get('Content-Type', '')
+                    if 'javascript' not in content_type:
+                        logger.warning(f"Skipping {js_url}: unexpected Content-Type '{content_type}'")
+                        return []
+                    if int(response.headers.get('Content-Length') or 0) > _MAX_JS_BYTES:
+                        logger.warning(f"Skipping {js_url}: body exceeds {_MAX_JS_BYTES} bytes")
+                        return []
+                    js_content = response.raw.read(_MAX_JS_BYTES, decode_content=True).decode('utf-8', 'ignore')
+                return extract_endpoints_from_js(js_content, url)
             except Exception as e:
                 logger.error(f"Error processing JavaScript file {js_url}: {str(e)}")
-        unique_endpoints = []
-        seen_urls = set()
-        for endpoint in endpoints:
-            if endpoint["url"] not in seen_urls and is_valid_url(endpoint["url"], base_domain):
-                seen_urls.add(endpoint["url"])
-                unique_endpoints.append(endpoint)
+            return []
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for js_endpoints in executor.map(fetch_js, js_urls):
+                for endpoint in js_endpoints:
+                    endpoints_by_url.setdefault(endpoint["url"], {
+                        "url": endpoint["url"],
+                        "method": endpoint["method"],
+                        "body_params": _EMPTY_BODY,
+                        "extra_headers": headers
+                    })
+        unique_endpoints = list(endpoints_by_url.values())
         try:
             output_format = output_file.split('.')[-1].lower() if '.' in output_file else 'json'
             if output_format == 'json':
-                with open(output_file, "w") as f:
-                    json.dump(unique_endpoints, f, indent=2)
+                with open(output_file, "wb", buffering=1 << 20) as f:
+                    f.write(orjson.dumps(unique_endpoints, option=orjson.OPT_INDENT_2))
             elif output_format == 'txt':
-                with open(output_file, "w") as f:
-                    for endpoint in unique_endpoints:
-                        f.write(f"{endpoint['url']}\n")
+                with open(output_file, "w", buffering=1 << 20) as f:
+                    f.writelines(f"{endpoint['url']}\n" for endpoint in unique_endpoints)
             elif output_format == 'csv':
-                with open(output_file, "w", newline='') as f:
+                with io.TextIOWrapper(open(output_file, "wb", buffering=1 << 20), newline='') as f:
                     writer = csv.writer(f)
                     writer.writerow(["URL", "Method", "Body Params", "Extra Headers"])
-                    for endpoint in unique_endpoints:
-                        writer.writerow([
+                    writer.writerows([
+                        [
                             endpoint['url'],
                             endpoint['method'],
-                            json.dumps(endpoint['body_params']),
-                            json.dumps(endpoint['extra_headers'])
-                        ])
+                            orjson.dumps(endpoint['body_params']).decode(),
+                            orjson.dumps(endpoint['extra_headers']).decode()
+                        ]
+                        for endpoint in unique_endpoints
+                    ])
             else:
                 raise ValueError(f"Unsupported output format: {output_format}. Use json, txt, or csv.")
             print(f"Endpoints saved to {output_file}")
@@ -320,9 +559,7 @@ def crawl_website(url, headers, max_pages, output_file, headless):
         return unique_endpoints
     except Exception as e:
         logger.error(f"Error occurred during crawling: {str(e)}")
-        return endpoints
-    finally:
-        driver.quit()
+        return list(endpoints_by_url.values())
 
 def main():
     parser = argparse.ArgumentParser(description="Web crawler to extract endpoints.")
@@ -330,6 +567,7 @@ def main():
     parser.add_argument("-m", "--max-pages", type=int, default=10, help="Maximum number of pages to crawl")
     parser.add_argument("-o", "--output", default="endpoints.json", help="Output file (json, txt, or csv)")
     parser.add_argument("-f", "--format", choices=['json', 'txt', 'csv'], default='json', help="Output format (json, txt, csv)")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="Number of parallel browser workers")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode")
     parser.add_argument("--header", action="append", help="Custom header in format 'Key: Value'")
 
@@ -350,7 +588,7 @@ def main():
     if args.output.split('.')[-1].lower() in ['json', 'txt', 'csv']:
         output_format = args.output.split('.')[-1].lower()
 
-    endpoints = crawl_website(args.url, headers, args.max_pages, args.output, args.headless)
+    endpoints = crawl_website(args.url, headers, args.max_pages, args.output, args.headless, args.workers)
     
     if endpoints:
         print("Captured endpoints:")